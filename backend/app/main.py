@@ -1,11 +1,92 @@
 from __future__ import annotations
 
+import os
 import re
-from typing import Dict, List, Optional, Tuple
-
-from fastapi import FastAPI
+import zlib
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
+
+from anyio import to_thread
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ValidationError
+
+
+# Retention formats: "30 days", "45d", "6 months", "90", "1 year"
+_RETENTION_RE = re.compile(r"(\d+)\s*(days?|d|months?|m|years?|y)\b")
+_RETENTION_UNIT_DAYS = {"d": 1, "m": 30, "y": 365}
+
+# Training/reuse signals, compiled once so each request scans the text in a single pass.
+_TRAINING_NEGATION_RE = re.compile(
+    "|".join(
+        [
+            r"\b(no|not|without)\s+(any\s+)?(training|train|fine[- ]?tune|finetune)\b",
+            r"\bdo not\s+(training|train|fine[- ]?tune|finetune)\b",
+            r"\bnot\s+used\s+for\s+training\b",
+        ]
+    )
+)
+_TRAINING_KEYWORD_RE = re.compile(
+    "|".join(
+        [
+            r"\btrain\b",
+            r"\bfine[- ]?tune\b",
+            r"\bfinetune\b",
+        ]
+        + [
+            re.escape(k)
+            for k in [
+                "improve the model",
+                "improve model",
+                "model improvement",
+                "learn from",
+                "reuse prompts",
+                "use prompts to improve",
+                "use logs to improve",
+                "use logs for training",
+            ]
+        ]
+    )
+)
+
+# Special category data: the explicit label plus proxy categories.
+_SPECIAL_CATEGORY_RE = re.compile(
+    r"special category|biometric|health|medical|genetic|religion|political|sexual|union|race|ethnic"
+)
+
+# Significant-effects indicators: profiling purposes, and consequential decisions in the description/product area.
+_PROFILING_PURPOSE_RE = re.compile(r"personalization|personalisation|profiling|targeting")
+_SIGNIFICANT_EFFECTS_RE = re.compile(
+    "|".join(
+        [
+            "eligibility",
+            "eligible",
+            "access",
+            "deny",
+            "approve",
+            "revoke",
+            "suspend",
+            "pricing",
+            "price",
+            "rate",
+            "quote",
+            "premium",
+            "credit",
+            "loan",
+            "insurance",
+            "admission",
+            "selection",
+            "employment",
+            "termination",
+        ]
+    )
+)
 
 
 class AssessmentRequest(BaseModel):
@@ -26,44 +107,343 @@ class AssessmentRequest(BaseModel):
     open_questions: Optional[str] = None
 
 
+RiskLevel = Literal["low", "medium", "high"]
+
+
 class RiskItem(BaseModel):
     id: str
     title: str
     gdpr_principle: str
-    impact: str
-    likelihood: str
+    impact: RiskLevel
+    likelihood: RiskLevel
     matched_on: str
     score: int
     description: Optional[str] = None
 
 
-class AssessmentResponse(BaseModel):
+# Prebuilt risk templates. They are built from literals under our control, so they skip
+# validation via model_construct and are shared across requests (never mutate them in place).
+_RISK_PROTOS: Dict[str, RiskItem] = {
+    "content_sensitivity_low": RiskItem.model_construct(
+        id="content_sensitivity_low",
+        title="Content sensitivity risk (security logging with safeguards)",
+        gdpr_principle="Data minimisation; storage limitation; integrity and confidentiality",
+        impact="low",
+        likelihood="low",
+        matched_on="Free-text user content + logging selected (security purpose, short retention inferred)",
+        score=2,
+        description="Free-text logging appears limited to security/safety purposes with short retention and no training/reuse signals. Residual risk is treated as controlled, subject to continued enforcement of safeguards.",
+    ),
+    "content_sensitivity": RiskItem.model_construct(
+        id="content_sensitivity",
+        title="Content sensitivity risk (free-text logging)",
+        gdpr_principle="Data minimisation; integrity and confidentiality",
+        impact="medium",
+        likelihood="medium",
+        matched_on="Free-text user content + logging selected",
+        score=6,
+        description="Logging free-text inputs increases the likelihood of capturing sensitive or confidential information and requires minimisation and access controls.",
+    ),
+    "storage_limitation": RiskItem.model_construct(
+        id="storage_limitation",
+        title="Storage limitation risk (retention > 30 days)",
+        gdpr_principle="Storage limitation",
+        impact="medium",
+        likelihood="high",
+        matched_on="Retention parsed as more than 30 days",
+        score=7,
+        description="Retention beyond 30 days increases exposure and requires a necessity/proportionality justification aligned to stated purposes.",
+    ),
+    "lawful_basis_uncertainty": RiskItem.model_construct(
+        id="lawful_basis_uncertainty",
+        title="Lawful basis uncertainty",
+        gdpr_principle="Lawfulness, fairness and transparency",
+        impact="medium",
+        likelihood="medium",
+        matched_on="Lawful basis candidate missing/unknown",
+        score=6,
+        description="A credible lawful basis must be identified and documented before deployment.",
+    ),
+    "vendor_processor": RiskItem.model_construct(
+        id="vendor_processor",
+        title="Third-party processor accountability",
+        gdpr_principle="Accountability; integrity and confidentiality",
+        impact="medium",
+        likelihood="medium",
+        matched_on="Vendors involved",
+        score=6,
+        description="Processor terms must cover instructions, security, retention, sub-processors, and auditability.",
+    ),
+    "international_transfers": RiskItem.model_construct(
+        id="international_transfers",
+        title="International transfers",
+        gdpr_principle="Lawfulness; accountability",
+        impact="medium",
+        likelihood="medium",
+        matched_on="Cross-border transfers indicated",
+        score=6,
+        description="Transfers require an appropriate mechanism and (where applicable) a transfer risk assessment per internal policy.",
+    ),
+    "training_or_reuse_user_content": RiskItem.model_construct(
+        id="training_or_reuse_user_content",
+        title="Training / reuse of user-provided content",
+        gdpr_principle="Purpose limitation; transparency; data minimisation",
+        impact="medium",
+        likelihood="medium",
+        matched_on="Training/reuse inferred from description or selected operations",
+        score=6,
+        description="Using prompts or user content to train or improve a model changes risk and governance expectations and requires explicit controls and transparency.",
+    ),
+    "automation_significant_effects": RiskItem.model_construct(
+        id="automation_significant_effects",
+        title="Automation with potentially significant effects",
+        gdpr_principle="Fairness; transparency; accountability",
+        impact="high",
+        likelihood="medium",
+        matched_on="Automation + significant-effects indicators inferred from purpose/product area/description",
+        score=8,
+        description="Automation appears linked to consequential decisions (e.g., access, eligibility, pricing) or profiling/personalisation; governance escalation is expected.",
+    ),
+    "automation_advisory": RiskItem.model_construct(
+        id="automation_advisory",
+        title="Automation present (no significant-effects indicators)",
+        gdpr_principle="Transparency; accountability",
+        impact="medium",
+        likelihood="medium",
+        matched_on="Automation selected without significant-effects indicators",
+        score=6,
+        description="Automation still requires clear explanations, meaningful human oversight, and a route to contest outcomes where relevant.",
+    ),
+}
+
+
+class AssessmentDecision(BaseModel):
     decision: str
     reasons: List[str]
     conditions: List[str] = []
     risks: List[RiskItem]
+
+
+class AssessmentResponse(AssessmentDecision):
     markdown: str
 
 
-app = FastAPI(title="AI Feature Risk & Accountability Toolkit (Backend)")
+@dataclass(frozen=True)
+class _Assessment:
+    decision: str
+    reasons: List[str]
+    conditions: List[str]
+    risks: List[RiskItem]
+    assumptions: List[str]
+    follow_ups: List[str]
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Assessments run in the anyio threadpool; widen it (default 40) so concurrent requests don't queue.
+    to_thread.current_default_thread_limiter().total_tokens = int(os.environ.get("ASSESS_THREADPOOL_SIZE", "64"))
+    yield
 
-# Dev-only CORS for local Vite frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+
+app = FastAPI(
+    title="AI Feature Risk & Accountability Toolkit (Backend)",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
 )
 
+# Dev-only CORS for local Vite frontend; opt in with ALLOW_CORS=1 so same-origin deployments skip the middleware.
+if os.environ.get("ALLOW_CORS") == "1":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[
+            o.strip() for o in os.environ.get("CORS_ALLOW_ORIGINS", "http://localhost:5173").split(",") if o.strip()
+        ],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+
+# Markdown reports compress well; small payloads are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Upper bound for gzip-encoded request bodies once decompressed.
+_MAX_DECOMPRESSED_BODY_BYTES = 1_000_000
+
 
 @app.get("/health")
 def health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
-@app.post("/assess", response_model=AssessmentResponse)
-def assess(req: AssessmentRequest) -> AssessmentResponse:
+# The request body is parsed by _read_assessment_request, so its schema is documented explicitly.
+_ASSESSMENT_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": AssessmentRequest.model_json_schema()}},
+    }
+}
+
+
+# Responses are built server-side from trusted values, so FastAPI's response-model
+# re-validation and jsonable_encoder pass are skipped; both schemas stay documented for OpenAPI.
+@app.post(
+    "/assess",
+    response_model=None,
+    responses={200: {"model": AssessmentResponse}},
+    openapi_extra=_ASSESSMENT_REQUEST_BODY,
+)
+async def assess(request: Request) -> ORJSONResponse:
+    req = await _read_assessment_request(request)
+    # The assessment itself is CPU-bound, so keep it off the event loop as the previous sync handler did.
+    resp = await run_in_threadpool(_assess_request, req)
+    return ORJSONResponse(content=resp.model_dump())
+
+
+# Decision only: skips markdown rendering so the UI can show the outcome before fetching the full report.
+@app.post(
+    "/assess/decision",
+    response_model=None,
+    responses={200: {"model": AssessmentDecision}},
+    openapi_extra=_ASSESSMENT_REQUEST_BODY,
+)
+async def assess_decision(request: Request) -> ORJSONResponse:
+    req = await _read_assessment_request(request)
+    result = await run_in_threadpool(_compute_request, req)
+    resp = AssessmentDecision.model_construct(
+        decision=result.decision, reasons=result.reasons, conditions=result.conditions, risks=result.risks
+    )
+    return ORJSONResponse(content=resp.model_dump())
+
+
+async def _read_assessment_request(request: Request) -> AssessmentRequest:
+    # Parse and validate the raw body in one pass (pydantic's JSON parser) instead of json.loads + validate.
+    body = await request.body()
+    content_encoding = request.headers.get("content-encoding", "").strip().lower()
+    if content_encoding == "gzip":
+        body = _gunzip_request_body(body)
+    elif content_encoding not in ("", "identity"):
+        raise HTTPException(status_code=415, detail="Unsupported Content-Encoding")
+    if not body:
+        raise RequestValidationError([{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}])
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=400, detail="There was an error parsing the body") from e
+    if not _is_json_content_type(request.headers.get("content-type")):
+        # Same contract as FastAPI's own body handling: non-JSON bodies are not parsed, so they fail as a 422.
+        raise RequestValidationError([_not_an_object_error(text)], body=text)
+    try:
+        return AssessmentRequest.model_validate_json(text)
+    except ValidationError as e:
+        raise RequestValidationError([_body_error(err) for err in e.errors(include_url=False)], body=text) from e
+
+
+def _body_error(err: Dict[str, Any]) -> Dict[str, Any]:
+    if err["type"] == "model_type" and not err["loc"]:
+        return _not_an_object_error(err["input"])
+    return {**err, "loc": ("body", *err["loc"])}
+
+
+def _not_an_object_error(value: Any) -> Dict[str, Any]:
+    # FastAPI validates bodies from attributes, so a body that is not a JSON object reports model_attributes_type.
+    return {
+        "type": "model_attributes_type",
+        "loc": ("body",),
+        "msg": "Input should be a valid dictionary or object to extract fields from",
+        "input": value,
+    }
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    # Mirrors FastAPI: a missing content type is treated as JSON, as are application/json and application/*+json.
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    main_type, _, subtype = media_type.partition("/")
+    return main_type == "application" and (subtype == "json" or subtype.endswith("+json"))
+
+
+def _gunzip_request_body(body: bytes) -> bytes:
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        out = decompressor.decompress(body, _MAX_DECOMPRESSED_BODY_BYTES)
+    except zlib.error as e:
+        raise HTTPException(status_code=400, detail="Invalid gzip request body") from e
+    if decompressor.unconsumed_tail:
+        raise HTTPException(status_code=413, detail="Decompressed request body too large")
+    if not decompressor.eof:
+        # A truncated stream decodes to a partial prefix; treat it as corrupt rather than as bad JSON.
+        raise HTTPException(status_code=400, detail="Invalid gzip request body")
+    return out
+
+
+# Requests with more text than this are assessed without caching, so the cache cannot pin large bodies.
+_MAX_CACHEABLE_REQUEST_CHARS = 8_000
+
+
+def _assess_request(req: AssessmentRequest) -> AssessmentResponse:
+    key = _request_key(req)
+    if _is_cacheable(key):
+        return _assess_cached(key)
+    return _assess(req, _compute(req))
+
+
+def _compute_request(req: AssessmentRequest) -> _Assessment:
+    key = _request_key(req)
+    if _is_cacheable(key):
+        return _compute_cached(key)
+    return _compute(req)
+
+
+def _is_cacheable(key: Tuple[Tuple[str, Any], ...]) -> bool:
+    size = 0
+    for _, value in key:
+        if isinstance(value, str):
+            size += len(value)
+        elif isinstance(value, tuple):
+            size += sum(len(v) for v in value)
+    return size <= _MAX_CACHEABLE_REQUEST_CHARS
+
+
+def _request_key(req: AssessmentRequest) -> Tuple[Tuple[str, Any], ...]:
+    # Lists keep their order: joined fields are keyword-scanned, so order can affect matches.
+    return tuple((name, tuple(value) if isinstance(value, list) else value) for name, value in req)
+
+
+def _request_from_key(key: Tuple[Tuple[str, Any], ...]) -> AssessmentRequest:
+    return AssessmentRequest.model_construct(**{name: list(value) if isinstance(value, tuple) else value for name, value in key})
+
+
+# The assessment is a pure function of the request, so identical re-submissions are served from cache.
+@lru_cache(maxsize=1024)
+def _assess_cached(key: Tuple[Tuple[str, Any], ...]) -> AssessmentResponse:
+    return _assess(_request_from_key(key), _compute_cached(key))
+
+
+@lru_cache(maxsize=1024)
+def _compute_cached(key: Tuple[Tuple[str, Any], ...]) -> _Assessment:
+    return _compute(_request_from_key(key))
+
+
+def _assess(req: AssessmentRequest, result: _Assessment) -> AssessmentResponse:
+    markdown = _render_markdown(
+        req=req,
+        decision=result.decision,
+        reasons=result.reasons,
+        risks=result.risks,
+        conditions=result.conditions,
+        assumptions=result.assumptions,
+        follow_ups=result.follow_ups,
+    )
+
+    # model_construct skips validation: only use it on trusted, server-built values (never on request input).
+    return AssessmentResponse.model_construct(
+        decision=result.decision, reasons=result.reasons, conditions=result.conditions, risks=result.risks, markdown=markdown
+    )
+
+
+def _compute(req: AssessmentRequest) -> _Assessment:
     reasons: List[str] = []
     conditions: List[str] = []
     risks: List[RiskItem] = []
@@ -73,12 +453,14 @@ def assess(req: AssessmentRequest) -> AssessmentResponse:
     operations = req.processing_operations or []
     purposes = req.purposes or []
 
-    lower_subjects = [s.lower() for s in data_subjects]
-    lower_categories = [c.lower() for c in data_categories]
-    lower_ops = [o.lower() for o in operations]
-    lower_purposes = [p.lower() for p in purposes]
+    # Join on a newline and lowercase once per field; keyword flags are plain substring checks on these
+    # blobs, and the newline keeps a keyword from matching across two entries.
+    subjects_blob = "\n".join(data_subjects).lower()
+    categories_blob = "\n".join(data_categories).lower()
+    ops_blob = "\n".join(operations).lower()
+    purposes_blob = "\n".join(purposes).lower()
 
-    has_minors = any(("child" in s) or ("minor" in s) or ("children" in s) for s in lower_subjects)
+    has_minors = ("child" in subjects_blob) or ("minor" in subjects_blob)
     has_special_category = _has_special_category_data(data_categories)
 
     retention_days = _parse_retention_days(req.retention)
@@ -91,8 +473,13 @@ def assess(req: AssessmentRequest) -> AssessmentResponse:
     )
 
     # Content logging inference (based on existing fields; no new UI fields)
-    content_like = any(("content" in c) or ("prompt" in c) or ("free-text" in c) or ("free text" in c) for c in lower_categories)
-    logging_like = any("log" in o for o in lower_ops)
+    content_like = (
+        ("content" in categories_blob)
+        or ("prompt" in categories_blob)
+        or ("free-text" in categories_blob)
+        or ("free text" in categories_blob)
+    )
+    logging_like = "log" in ops_blob
     content_logged = content_like and logging_like
 
     # Training / reuse inference (from ops or description keywords)
@@ -103,7 +490,7 @@ def assess(req: AssessmentRequest) -> AssessmentResponse:
     )
 
     # Automation nuance: only escalate when significant effects are inferred
-    has_automation = any("automated decision" in o for o in lower_ops)
+    has_automation = "automated decision" in ops_blob
     inferred_significant_effects = _infer_significant_effects(
         feature_description=req.feature_description,
         product_area=req.product_area,
@@ -112,15 +499,16 @@ def assess(req: AssessmentRequest) -> AssessmentResponse:
     )
 
     # Purpose gating (for SHIP criteria)
+    security_purpose = ("security" in purposes_blob) or ("safety" in purposes_blob)
     allowed_purposes = {"safety & security", "safety / security", "safety", "security", "product improvement"}
-    purpose_ok = any(p in allowed_purposes for p in lower_purposes)
+    purpose_ok = any(p.lower() in allowed_purposes for p in purposes)
     retention_ok = (retention_days is None) or (retention_days <= 30)
 
     # --- Risk patterns (principle-based, deterministic) ---
+    # Risks reuse the shared prototypes; only fields that vary per request are copied with updates.
 
     # Content sensitivity risk (nuanced so security + short retention can still SHIP)
     if content_logged:
-        security_purpose = any(("security" in p) or ("safety" in p) for p in lower_purposes)
         cross_border_ok = (req.cross_border_transfers is None) or (req.cross_border_transfers in {"None", "Within EEA"})
         vendor_ok = not bool(req.vendors_involved)
 
@@ -134,31 +522,9 @@ def assess(req: AssessmentRequest) -> AssessmentResponse:
         )
 
         if low_sensitivity:
-            risks.append(
-                RiskItem(
-                    id="content_sensitivity_low",
-                    title="Content sensitivity risk (security logging with safeguards)",
-                    gdpr_principle="Data minimisation; storage limitation; integrity and confidentiality",
-                    impact="low",
-                    likelihood="low",
-                    matched_on="Free-text user content + logging selected (security purpose, short retention inferred)",
-                    score=2,
-                    description="Free-text logging appears limited to security/safety purposes with short retention and no training/reuse signals. Residual risk is treated as controlled, subject to continued enforcement of safeguards.",
-                )
-            )
+            risks.append(_RISK_PROTOS["content_sensitivity_low"])
         else:
-            risks.append(
-                RiskItem(
-                    id="content_sensitivity",
-                    title="Content sensitivity risk (free-text logging)",
-                    gdpr_principle="Data minimisation; integrity and confidentiality",
-                    impact="medium",
-                    likelihood="medium",
-                    matched_on="Free-text user content + logging selected",
-                    score=6,
-                    description="Logging free-text inputs increases the likelihood of capturing sensitive or confidential information and requires minimisation and access controls.",
-                )
-            )
+            risks.append(_RISK_PROTOS["content_sensitivity"])
             conditions.extend(
                 [
                     "Implement content logging minimisation (log only what is necessary; avoid storing raw prompts where possible).",
@@ -168,80 +534,28 @@ def assess(req: AssessmentRequest) -> AssessmentResponse:
             )
 
     if retention_over_30:
-        risks.append(
-            RiskItem(
-                id="storage_limitation",
-                title="Storage limitation risk (retention > 30 days)",
-                gdpr_principle="Storage limitation",
-                impact="medium",
-                likelihood="high",
-                matched_on=f"Retention parsed as {retention_days} days",
-                score=7,
-                description="Retention beyond 30 days increases exposure and requires a necessity/proportionality justification aligned to stated purposes.",
-            )
-        )
+        risks.append(_RISK_PROTOS["storage_limitation"].model_copy(update={"matched_on": f"Retention parsed as {retention_days} days"}))
         conditions.append(
             "Reduce retention to ≤ 30 days or document a necessity/proportionality justification with safeguards (e.g., aggregation, minimisation)."
         )
 
     if lawful_basis_missing:
-        risks.append(
-            RiskItem(
-                id="lawful_basis_uncertainty",
-                title="Lawful basis uncertainty",
-                gdpr_principle="Lawfulness, fairness and transparency",
-                impact="medium",
-                likelihood="medium",
-                matched_on="Lawful basis candidate missing/unknown",
-                score=6,
-                description="A credible lawful basis must be identified and documented before deployment.",
-            )
-        )
+        risks.append(_RISK_PROTOS["lawful_basis_uncertainty"])
         conditions.append("Define and document the lawful basis (and, where relevant, complete LIA/consent design) before launch.")
 
     if req.vendors_involved:
-        risks.append(
-            RiskItem(
-                id="vendor_processor",
-                title="Third-party processor accountability",
-                gdpr_principle="Accountability; integrity and confidentiality",
-                impact="medium",
-                likelihood="medium",
-                matched_on="Vendors involved",
-                score=6,
-                description="Processor terms must cover instructions, security, retention, sub-processors, and auditability.",
-            )
-        )
+        risks.append(_RISK_PROTOS["vendor_processor"])
         conditions.append("Verify vendor processor terms, sub-processor controls, retention commitments, and security due diligence.")
 
     if req.cross_border_transfers and req.cross_border_transfers not in {"None", "Within EEA"}:
-        risks.append(
-            RiskItem(
-                id="international_transfers",
-                title="International transfers",
-                gdpr_principle="Lawfulness; accountability",
-                impact="medium",
-                likelihood="medium",
-                matched_on=f"Cross-border transfers: {req.cross_border_transfers}",
-                score=6,
-                description="Transfers require an appropriate mechanism and (where applicable) a transfer risk assessment per internal policy.",
-            )
-        )
+        risks.append(_RISK_PROTOS["international_transfers"].model_copy(update={"matched_on": f"Cross-border transfers: {req.cross_border_transfers}"}))
         conditions.append("Confirm and document transfer mechanism (e.g., SCCs) and complete transfer risk assessment where required.")
 
     if training_or_reuse:
-        risks.append(
-            RiskItem(
-                id="training_or_reuse_user_content",
-                title="Training / reuse of user-provided content",
-                gdpr_principle="Purpose limitation; transparency; data minimisation",
-                impact="high" if (has_special_category or has_minors) else "medium",
-                likelihood="medium",
-                matched_on="Training/reuse inferred from description or selected operations",
-                score=8 if (has_special_category or has_minors) else 6,
-                description="Using prompts or user content to train or improve a model changes risk and governance expectations and requires explicit controls and transparency.",
-            )
-        )
+        training_risk = _RISK_PROTOS["training_or_reuse_user_content"]
+        if has_special_category or has_minors:
+            training_risk = training_risk.model_copy(update={"impact": "high", "score": 8})
+        risks.append(training_risk)
         conditions.extend(
             [
                 "Make training/reuse transparent in user-facing documentation and in-product disclosures, including consequences.",
@@ -251,31 +565,9 @@ def assess(req: AssessmentRequest) -> AssessmentResponse:
         )
 
     if has_automation and inferred_significant_effects:
-        risks.append(
-            RiskItem(
-                id="automation_significant_effects",
-                title="Automation with potentially significant effects",
-                gdpr_principle="Fairness; transparency; accountability",
-                impact="high",
-                likelihood="medium",
-                matched_on="Automation + significant-effects indicators inferred from purpose/product area/description",
-                score=8,
-                description="Automation appears linked to consequential decisions (e.g., access, eligibility, pricing) or profiling/personalisation; governance escalation is expected.",
-            )
-        )
+        risks.append(_RISK_PROTOS["automation_significant_effects"])
     elif has_automation and not inferred_significant_effects:
-        risks.append(
-            RiskItem(
-                id="automation_advisory",
-                title="Automation present (no significant-effects indicators)",
-                gdpr_principle="Transparency; accountability",
-                impact="medium",
-                likelihood="medium",
-                matched_on="Automation selected without significant-effects indicators",
-                score=6,
-                description="Automation still requires clear explanations, meaningful human oversight, and a route to contest outcomes where relevant.",
-            )
-        )
+        risks.append(_RISK_PROTOS["automation_advisory"])
         conditions.extend(
             [
                 "Document the role of automation and implement meaningful human oversight in practice.",
@@ -341,18 +633,15 @@ def assess(req: AssessmentRequest) -> AssessmentResponse:
         lawful_basis_missing=lawful_basis_missing,
     )
 
-    markdown = _render_markdown(
-        req=req,
+    return _Assessment(
         decision=decision,
         reasons=reasons,
-        risks=risks,
         conditions=conditions,
+        risks=risks,
         assumptions=assumptions,
         follow_ups=follow_ups,
     )
 
-    return AssessmentResponse(decision=decision, reasons=reasons, conditions=conditions, risks=risks, markdown=markdown)
-
 
 def _render_markdown(
     req: AssessmentRequest,
@@ -363,40 +652,48 @@ def _render_markdown(
     assumptions: List[str],
     follow_ups: List[str],
 ) -> str:
-    reasons_lines = "\n".join([f"- {r}" for r in reasons])
-    conditions_lines = "\n".join([f"- {c}" for c in conditions])
-    assumptions_lines = "\n".join([f"- {a}" for a in assumptions])
-    follow_ups_lines = "\n".join([f"- {q}" for q in follow_ups])
-    risk_lines = "\n".join(
-        [
-            f"- **{r.title}** — principle: {r.gdpr_principle} (impact: {r.impact}, likelihood: {r.likelihood}) — matched on: {r.matched_on}"
-            for r in risks
-        ]
-    )
-
-    return f"""# AI Feature Risk Assessment
-
-## Executive summary
-**Decision:** {decision}
-
-## Feature overview
-**Feature name:** {req.feature_name}
-
-## Assumptions
-{assumptions_lines or "_None._"}
-
-## Decision rationale
-{reasons_lines or "_None provided._"}
-
-## Conditions (if applicable)
-{conditions_lines or "_None._"}
-
-## Identified risks
-{risk_lines or "_No risks returned._"}
-
-## Open questions / Follow-ups
-{follow_ups_lines or "_None._"}
-"""
+    # Built as one parts list and joined once, rather than via intermediate per-section strings.
+    out: List[str] = []
+    ap = out.append
+
+    def bullets(items: List[str], empty: str) -> None:
+        if not items:
+            ap(empty)
+            ap("\n")
+            return
+        for item in items:
+            ap("- ")
+            ap(item)
+            ap("\n")
+
+    ap("# AI Feature Risk Assessment\n\n## Executive summary\n**Decision:** ")
+    ap(decision)
+    ap("\n\n## Feature overview\n**Feature name:** ")
+    ap(req.feature_name)
+    ap("\n\n## Assumptions\n")
+    bullets(assumptions, "_None._")
+    ap("\n## Decision rationale\n")
+    bullets(reasons, "_None provided._")
+    ap("\n## Conditions (if applicable)\n")
+    bullets(conditions, "_None._")
+    ap("\n## Identified risks\n")
+    if not risks:
+        ap("_No risks returned._\n")
+    for r in risks:
+        ap("- **")
+        ap(r.title)
+        ap("** — principle: ")
+        ap(r.gdpr_principle)
+        ap(" (impact: ")
+        ap(r.impact)
+        ap(", likelihood: ")
+        ap(r.likelihood)
+        ap(") — matched on: ")
+        ap(r.matched_on)
+        ap("\n")
+    ap("\n## Open questions / Follow-ups\n")
+    bullets(follow_ups, "_None._")
+    return "".join(out)
 
 
 def _parse_retention_days(retention: Optional[str]) -> Optional[int]:
@@ -407,18 +704,16 @@ def _parse_retention_days(retention: Optional[str]) -> Optional[int]:
     if not s:
         return None
 
-    # Common formats: "30 days", "45d", "6 months", "90", "1 year"
-    m = re.search(r"(\d+)\s*(day|days|d)\b", s)
-    if m:
-        return int(m.group(1))
-
-    m = re.search(r"(\d+)\s*(month|months|m)\b", s)
-    if m:
-        return int(m.group(1)) * 30
-
-    m = re.search(r"(\d+)\s*(year|years|y)\b", s)
-    if m:
-        return int(m.group(1)) * 365
+    # One scan; an explicit day count wins over months, and months over years.
+    first: Dict[str, int] = {}
+    for m in _RETENTION_RE.finditer(s):
+        unit = m.group(2)[0]
+        if unit == "d":
+            return int(m.group(1))
+        first.setdefault(unit, int(m.group(1)))
+    for unit in ("m", "y"):
+        if unit in first:
+            return first[unit] * _RETENTION_UNIT_DAYS[unit]
 
     # If only a number is provided, treat as days
     if s.isdigit():
@@ -428,28 +723,8 @@ def _parse_retention_days(retention: Optional[str]) -> Optional[int]:
 
 
 def _has_special_category_data(data_categories: List[str]) -> bool:
-    mapping_keywords = {
-        # Explicit
-        "special category",
-        # Proxies
-        "biometric",
-        "health",
-        "medical",
-        "genetic",
-        "religion",
-        "political",
-        "sexual",
-        "union",
-        "race",
-        "ethnic",
-    }
-    for c in data_categories:
-        cl = (c or "").strip().lower()
-        if not cl:
-            continue
-        if any(kw in cl for kw in mapping_keywords):
-            return True
-    return False
+    joined = "\n".join(c.lower() for c in data_categories if c)
+    return _SPECIAL_CATEGORY_RE.search(joined) is not None
 
 
 def _infer_training_or_reuse(feature_description: str, processing_operations: List[str], purposes: List[str]) -> bool:
@@ -457,33 +732,15 @@ def _infer_training_or_reuse(feature_description: str, processing_operations: Li
     desc = (feature_description or "").lower()
     p = " ".join(purposes).lower()
 
-    if "training" in ops or "train" in ops:
+    if "train" in ops:
         return True
 
     # Deterministic negation handling to avoid false positives like "no training".
     haystack = f"{desc} {p}"
-    negation_patterns = [
-        r"\b(no|not|without)\s+(any\s+)?(training|train|fine[- ]?tune|finetune)\b",
-        r"\bdo not\s+(training|train|fine[- ]?tune|finetune)\b",
-        r"\bnot\s+used\s+for\s+training\b",
-    ]
-    if any(re.search(pat, haystack) for pat in negation_patterns):
+    if _TRAINING_NEGATION_RE.search(haystack):
         return False
 
-    keywords = [
-        r"\btrain\b",
-        r"\bfine[- ]?tune\b",
-        r"\bfinetune\b",
-        "improve the model",
-        "improve model",
-        "model improvement",
-        "learn from",
-        "reuse prompts",
-        "use prompts to improve",
-        "use logs to improve",
-        "use logs for training",
-    ]
-    return any((k in haystack) if " " in k else re.search(k, haystack) for k in keywords)
+    return _TRAINING_KEYWORD_RE.search(haystack) is not None
 
 
 def _infer_significant_effects(
@@ -497,33 +754,23 @@ def _infer_significant_effects(
     p = " ".join(purposes).lower()
     ops = " ".join(processing_operations).lower()
 
-    profiling_signal = any(x in p for x in ["personalization", "personalisation", "profiling", "targeting"])
-    profiling_op_signal = "profil" in ops
-
-    significant_keywords = [
-        "eligibility",
-        "eligible",
-        "access",
-        "deny",
-        "approve",
-        "revoke",
-        "suspend",
-        "pricing",
-        "price",
-        "rate",
-        "quote",
-        "premium",
-        "credit",
-        "loan",
-        "insurance",
-        "admission",
-        "selection",
-        "employment",
-        "termination",
-    ]
-    significant_signal = any(k in desc for k in significant_keywords) or any(k in area for k in significant_keywords)
-
-    return profiling_signal or profiling_op_signal or significant_signal
+    return bool(
+        _PROFILING_PURPOSE_RE.search(p)
+        or "profil" in ops
+        or _SIGNIFICANT_EFFECTS_RE.search(desc)
+        or _SIGNIFICANT_EFFECTS_RE.search(area)
+    )
+
+
+# Bits describing which assumption/follow-up branches apply to a request.
+_AF_RETENTION_PARSED = 1 << 0
+_AF_RETENTION_PROVIDED = 1 << 1
+_AF_AUTOMATION = 1 << 2
+_AF_SIGNIFICANT_EFFECTS = 1 << 3
+_AF_TRAINING = 1 << 4
+_AF_LAWFUL_BASIS_MISSING = 1 << 5
+_AF_VENDORS = 1 << 6
+_AF_CROSS_BORDER = 1 << 7
 
 
 def _build_assumptions_and_followups(
@@ -534,47 +781,65 @@ def _build_assumptions_and_followups(
     training_or_reuse: bool,
     lawful_basis_missing: bool,
 ) -> Tuple[List[str], List[str]]:
+    mask = 0
+    if retention_days is not None:
+        mask |= _AF_RETENTION_PARSED
+    if req.retention:
+        mask |= _AF_RETENTION_PROVIDED
+    if has_automation:
+        mask |= _AF_AUTOMATION
+    if inferred_significant_effects:
+        mask |= _AF_SIGNIFICANT_EFFECTS
+    if training_or_reuse:
+        mask |= _AF_TRAINING
+    if lawful_basis_missing:
+        mask |= _AF_LAWFUL_BASIS_MISSING
+    if req.vendors_involved:
+        mask |= _AF_VENDORS
+    if req.cross_border_transfers and req.cross_border_transfers not in {"None", "Within EEA"}:
+        mask |= _AF_CROSS_BORDER
+
+    assumptions, follow_ups = _assumptions_and_followups_for(mask)
+    return list(assumptions), list(follow_ups)
+
+
+@lru_cache(maxsize=256)
+def _assumptions_and_followups_for(mask: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    # At most 256 masks, so each phrase combination is built once and then served from the table.
     assumptions: List[str] = []
     follow_ups: List[str] = []
 
-    if retention_days is None and req.retention:
+    if not mask & _AF_RETENTION_PARSED and mask & _AF_RETENTION_PROVIDED:
         assumptions.append("Retention period could not be parsed; the assessment assumes retention is interpreted as provided by the feature team.")
         follow_ups.append("Confirm the exact retention period in days and whether automated deletion is enforced.")
-    elif retention_days is None:
+    elif not mask & _AF_RETENTION_PARSED:
         assumptions.append("Retention period is not specified; the assessment assumes data is not retained beyond what is necessary for stated purposes.")
         follow_ups.append("Confirm the retention period and deletion mechanism for logs and user content.")
 
-    if has_automation:
+    if mask & _AF_AUTOMATION:
         assumptions.append("Automation is present based on selected processing operations.")
-        if inferred_significant_effects:
+        if mask & _AF_SIGNIFICANT_EFFECTS:
             follow_ups.append("Confirm whether automated outputs are used for access, eligibility, pricing, or other similarly significant decisions.")
         else:
             follow_ups.append("Confirm whether automation has any similarly significant effects for individuals (or is advisory only).")
             follow_ups.append("Confirm the human oversight workflow and how users can contest outcomes where relevant.")
 
-    if training_or_reuse:
+    if mask & _AF_TRAINING:
         assumptions.append("Training/reuse of user content is inferred from provided inputs or description keywords.")
         follow_ups.append("Confirm whether user content is used for training/reuse, the scope (opt-in/opt-out), and the default setting.")
         follow_ups.append("Confirm minimisation measures for training datasets (e.g., filtering, exclusion of sensitive content).")
 
-    if lawful_basis_missing:
+    if mask & _AF_LAWFUL_BASIS_MISSING:
         follow_ups.append("Confirm the lawful basis and record the rationale in the governance documentation.")
 
-    if req.vendors_involved:
+    if mask & _AF_VENDORS:
         follow_ups.append("Confirm vendor roles, data flows, and the status of processor terms and security due diligence.")
 
-    if req.cross_border_transfers and req.cross_border_transfers not in {"None", "Within EEA"}:
+    if mask & _AF_CROSS_BORDER:
         follow_ups.append("Confirm transfer mechanism and whether a transfer risk assessment is required by internal policy.")
 
-    return assumptions, follow_ups
+    return tuple(assumptions), tuple(follow_ups)
 
 
 def _dedupe_preserve_order(items: List[str]) -> List[str]:
-    seen = set()
-    out: List[str] = []
-    for x in items:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
-
+    return list(dict.fromkeys(items))
@@ -0,0 +1,104 @@
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import _MAX_DECOMPRESSED_BODY_BYTES, app
+
+client = TestClient(app)
+
+PAYLOAD = {
+    "feature_name": "Support chat summaries",
+    "feature_description": "Summarise support chats for agents.",
+    "product_area": "Support",
+    "jurisdictions": ["EU"],
+    "data_subjects": ["Customers"],
+    "data_categories": ["Contact details"],
+    "processing_operations": ["Logging"],
+    "purposes": ["Product improvement"],
+    "retention": "30 days",
+}
+
+
+@pytest.mark.parametrize("path", ["/assess", "/assess/decision"])
+def test_valid_body_is_assessed(path):
+    resp = client.post(path, content=json.dumps(PAYLOAD), headers={"content-type": "application/json"})
+    assert resp.status_code == 200
+    assert resp.json()["decision"] in {"SHIP", "SHIP WITH CONDITIONS", "ESCALATE"}
+
+
+@pytest.mark.parametrize("path", ["/assess", "/assess/decision"])
+def test_invalid_utf8_body_is_rejected(path):
+    resp = client.post(path, content=b"\xff\xfe{", headers={"content-type": "application/json"})
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "There was an error parsing the body"}
+
+
+def test_empty_body_reports_missing():
+    resp = client.post("/assess", content=b"", headers={"content-type": "application/json"})
+    assert resp.status_code == 422
+    assert [(e["type"], e["loc"]) for e in resp.json()["detail"]] == [("missing", ["body"])]
+
+
+def test_non_object_body_reports_model_attributes_type():
+    resp = client.post("/assess", content=b"[1]", headers={"content-type": "application/json"})
+    assert resp.status_code == 422
+    assert [(e["type"], e["loc"], e["input"]) for e in resp.json()["detail"]] == [("model_attributes_type", ["body"], [1])]
+
+
+def test_non_json_content_type_is_not_parsed():
+    resp = client.post("/assess", content=json.dumps(PAYLOAD), headers={"content-type": "text/plain"})
+    assert resp.status_code == 422
+    assert [(e["type"], e["loc"]) for e in resp.json()["detail"]] == [("model_attributes_type", ["body"])]
+
+
+def test_invalid_json_reports_json_invalid():
+    resp = client.post("/assess", content=b"{", headers={"content-type": "application/json"})
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["type"] == "json_invalid"
+
+
+def _post_gzip(body, encoding="gzip"):
+    headers = {"content-type": "application/json", "content-encoding": encoding}
+    return client.post("/assess", content=body, headers=headers)
+
+
+def test_gzip_body_is_decompressed():
+    resp = _post_gzip(gzip.compress(json.dumps(PAYLOAD).encode()))
+    assert resp.status_code == 200
+    assert resp.json()["decision"] in {"SHIP", "SHIP WITH CONDITIONS", "ESCALATE"}
+
+
+def test_corrupt_gzip_body_is_rejected():
+    resp = _post_gzip(b"not gzip at all")
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "Invalid gzip request body"}
+
+
+def test_truncated_gzip_body_is_rejected():
+    resp = _post_gzip(gzip.compress(json.dumps(PAYLOAD).encode())[:-12])
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "Invalid gzip request body"}
+
+
+def test_oversized_gzip_body_is_rejected():
+    resp = _post_gzip(gzip.compress(b" " * (_MAX_DECOMPRESSED_BODY_BYTES + 1)))
+    assert resp.status_code == 413
+
+
+def test_gzip_body_with_invalid_utf8_is_rejected():
+    resp = _post_gzip(gzip.compress(b"\xff\xfe{"))
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "There was an error parsing the body"}
+
+
+@pytest.mark.parametrize("encoding", ["br", "deflate", "gzip, br"])
+def test_unsupported_content_encoding_is_rejected(encoding):
+    resp = _post_gzip(gzip.compress(json.dumps(PAYLOAD).encode()), encoding=encoding)
+    assert resp.status_code == 415
+
+
+def test_identity_content_encoding_is_accepted():
+    resp = _post_gzip(json.dumps(PAYLOAD).encode(), encoding="identity")
+    assert resp.status_code == 200
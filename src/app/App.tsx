@@ -6,6 +6,13 @@ import type { AssessmentRequest, AssessmentResponse, Decision, RiskItem } from "
 
 type AssessmentState = 'form' | 'results';
 
+// Fixed form options, defined once rather than rebuilt on every render.
+const DATA_SUBJECT_OPTIONS = ["End users", "Employees", "Business partners", "Children (under applicable data protection law)"] as const;
+const DATA_CATEGORY_OPTIONS = ["Personal identifiers", "Behavioral data", "Biometric data", "Special category data"] as const;
+const PROCESSING_OPERATION_OPTIONS = ["Collection", "Storage", "Analysis", "Automated decision-making"] as const;
+const PURPOSE_OPTIONS = ["Product improvement", "User personalization", "Safety & security", "Research"] as const;
+const RISK_APPETITE_LEVELS = ["Low", "Medium", "High"] as const;
+
 function toDecisionBadge(decision: string): { label: string; className: string } {
   const normalized = decision.toUpperCase().replace(/\s+/g, "_");
   const d = normalized as Decision;
@@ -79,22 +86,29 @@ export default function App() {
     setFormError(null);
     setDemoNotice(null);
 
-    if (!featureName.trim() || !featureDescription.trim()) {
+    // Strip each text field once; the trimmed values feed both validation and the payload.
+    const name = featureName.trim();
+    const description = featureDescription.trim();
+    const area = productArea.trim();
+    const jurisdictions = jurisdictionsText.trim();
+    const retentionValue = retention.trim();
+
+    if (!name || !description) {
       setFormError("Please fill in the required fields: Feature name and Feature description.");
       return;
     }
 
     const payload: AssessmentRequest = {
-      feature_name: featureName.trim(),
-      feature_description: featureDescription.trim(),
-      product_area: productArea.trim() || undefined,
-      jurisdictions: jurisdictionsText.trim() ? parseCommaList(jurisdictionsText) : undefined,
+      feature_name: name,
+      feature_description: description,
+      product_area: area || undefined,
+      jurisdictions: jurisdictions ? parseCommaList(jurisdictions) : undefined,
       data_subjects: dataSubjects.length ? dataSubjects : undefined,
       data_categories: dataCategories.length ? dataCategories : undefined,
       processing_operations: processingOperations.length ? processingOperations : undefined,
       purposes: purposes.length ? purposes : undefined,
       lawful_basis_candidate: lawfulBasisCandidate || undefined,
-      retention: retention.trim() || undefined,
+      retention: retentionValue || undefined,
       vendors_involved: vendorsInvolved,
       cross_border_transfers: crossBorderTransfers,
       risk_appetite: riskAppetite,
@@ -220,7 +234,7 @@ export default function App() {
                   <div>
                     <label className="block text-[#0f172a] mb-2">Data subjects</label>
                     <div className="space-y-2">
-                      {['End users', 'Employees', 'Business partners', 'Children (under applicable data protection law)'].map((option) => (
+                      {DATA_SUBJECT_OPTIONS.map((option) => (
                         <label key={option} className="flex items-center">
                           <input
                             type="checkbox"
@@ -239,7 +253,7 @@ export default function App() {
                   <div>
                     <label className="block text-[#0f172a] mb-2">Data categories</label>
                     <div className="space-y-2">
-                      {['Personal identifiers', 'Behavioral data', 'Biometric data', 'Special category data'].map((option) => (
+                      {DATA_CATEGORY_OPTIONS.map((option) => (
                         <label key={option} className="flex items-center">
                           <input
                             type="checkbox"
@@ -258,7 +272,7 @@ export default function App() {
                   <div>
                     <label className="block text-[#0f172a] mb-2">Processing operations</label>
                     <div className="space-y-2">
-                      {['Collection', 'Storage', 'Analysis', 'Automated decision-making'].map((option) => (
+                      {PROCESSING_OPERATION_OPTIONS.map((option) => (
                         <label key={option} className="flex items-center">
                           <input
                             type="checkbox"
@@ -277,7 +291,7 @@ export default function App() {
                   <div>
                     <label className="block text-[#0f172a] mb-2">Purpose(s)</label>
                     <div className="space-y-2">
-                      {['Product improvement', 'User personalization', 'Safety & security', 'Research'].map((option) => (
+                      {PURPOSE_OPTIONS.map((option) => (
                         <label key={option} className="flex items-center">
                           <input
                             type="checkbox"
@@ -366,7 +380,7 @@ export default function App() {
                   <div>
                     <label className="block text-[#0f172a] mb-3">Risk appetite</label>
                     <div className="flex gap-3">
-                      {['Low', 'Medium', 'High'].map((level) => (
+                      {RISK_APPETITE_LEVELS.map((level) => (
                         <label key={level} className="flex items-center px-4 py-2 border border-[#cbd5e1] rounded cursor-pointer hover:bg-[#f8f9fa]">
                           <input
                             type="radio"
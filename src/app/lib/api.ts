@@ -7,19 +7,61 @@ function getBackendBaseUrl(): string {
   return (fromEnv && fromEnv.trim()) || "http://localhost:8000";
 }
 
+// Assessments are deterministic, so identical submissions reuse the last backend response.
+const RESPONSE_CACHE_LIMIT = 50;
+const responseCache = new Map<string, AssessmentResponse>();
+
+function rememberResponse(key: string, data: AssessmentResponse) {
+  responseCache.delete(key);
+  responseCache.set(key, data);
+  if (responseCache.size > RESPONSE_CACHE_LIMIT) {
+    // Maps iterate in insertion order, so the first key is the least recently used.
+    responseCache.delete(responseCache.keys().next().value as string);
+  }
+}
+
+// Only bodies above this many UTF-8 bytes are gzip-compressed; smaller ones are not worth the extra work.
+const GZIP_MIN_BYTES = 1024;
+
+async function encodeRequestBody(body: string): Promise<{ body: BodyInit; headers: Record<string, string> }> {
+  const headers: Record<string, string> = { "content-type": "application/json" };
+  if (typeof CompressionStream === "undefined") {
+    return { body, headers };
+  }
+
+  // Measure the UTF-8 size, not body.length (UTF-16 code units), so non-ASCII drafts use the right threshold.
+  const bytes = new TextEncoder().encode(body);
+  if (bytes.byteLength <= GZIP_MIN_BYTES) {
+    return { body, headers };
+  }
+
+  const compressed = await new Response(
+    new Blob([bytes]).stream().pipeThrough(new CompressionStream("gzip")),
+  ).arrayBuffer();
+  return { body: compressed, headers: { ...headers, "content-encoding": "gzip" } };
+}
+
 export async function assessFeature(payload: AssessmentRequest): Promise<{
   data: AssessmentResponse;
   isDemoFallback: boolean;
 }> {
+  const body = JSON.stringify(payload);
+  const cached = responseCache.get(body);
+  if (cached) {
+    rememberResponse(body, cached);
+    return { data: cached, isDemoFallback: false };
+  }
+
   const baseUrl = getBackendBaseUrl().replace(/\/+$/, "");
   const controller = new AbortController();
   const timeout = window.setTimeout(() => controller.abort(), 10_000);
 
   try {
+    const encoded = await encodeRequestBody(body);
     const resp = await fetch(`${baseUrl}/assess`, {
       method: "POST",
-      headers: { "content-type": "application/json" },
-      body: JSON.stringify(payload),
+      headers: encoded.headers,
+      body: encoded.body,
       signal: controller.signal,
     });
 
@@ -28,7 +70,9 @@ export async function assessFeature(payload: AssessmentRequest): Promise<{
     }
 
     const json = await resp.json();
-    return { data: normalizeAssessmentResponse(json), isDemoFallback: false };
+    const data = normalizeAssessmentResponse(json);
+    rememberResponse(body, data);
+    return { data, isDemoFallback: false };
   } catch (_e) {
     // Deterministic fallback for demo mode (do not crash UI)
     return { data: MOCK_ASSESSMENT, isDemoFallback: true };